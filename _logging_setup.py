@@ -0,0 +1,45 @@
+import logging
+import os
+
+from logging.handlers import RotatingFileHandler
+
+
+class _LazyDirRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that creates the log directory as part of the
+    delayed first open, so invocations that never emit a record never
+    issue the mkdir syscall.
+    """
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+def get_logger(log_name):
+    logger = logging.getLogger(__name__)
+    if logger.handlers:
+        # logging.getLogger already returns a singleton; the guard just
+        # keeps repeated calls from stacking duplicate handlers.
+        return logger
+    logger.setLevel(logging.INFO)
+
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.INFO)
+    ch.setFormatter(
+        logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
+    )
+
+    fh = _LazyDirRotatingFileHandler(
+        f"logs/{log_name}.log",
+        maxBytes=1024 * 1024 * 10,
+        backupCount=10,
+        delay=True  # defer the open() until the first record is emitted
+    )
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(
+        logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
+    )
+
+    logger.addHandler(ch)
+    logger.addHandler(fh)
+    return logger
@@ -1,45 +1,47 @@
-import argparse
+from __future__ import annotations
+
 import json
-import logging
 import os
+import sys
 
 from datetime import datetime
 from enum import Enum
-from typing import Tuple, List
 from dataclasses import dataclass
-from functools import lru_cache
-from logging.handlers import RotatingFileHandler
 
-MAX_TASK_NAME_LENGTH = 100
-TASKS_FILE = "tasks.json"
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@lru_cache(maxsize=None)
-def get_logger(log_name):
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO)
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    # Stdlib fallback: compact separators keep the output close to orjson's
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _loads = json.loads
 
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.INFO)
-    ch.setFormatter(
-        logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
-    )
+__version__ = "1.0.0"
 
-    os.makedirs(f"logs", exist_ok=True)
-    fh = RotatingFileHandler(
-        f"logs/{log_name}.log", 
-        maxBytes=1024 * 1024 * 10, 
-        backupCount=10
-    )
-    fh.setLevel(logging.DEBUG)
-    fh.setFormatter(
-        logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
-    )
+MAX_TASK_NAME_LENGTH = 100
+TASKS_FILE = "tasks.json"
+TASKS_LOG_FILE = "tasks.log"
+COMPACT_THRESHOLD = 64 * 1024  # compact the log once it exceeds 64 KiB
 
-    logger.addHandler(ch)
-    logger.addHandler(fh)
-    return logger
+class _LazyLogger:
+    """
+    Stand-in for the real logger that defers all logging setup (handler
+    construction, creating the logs/ directory) until the first log call.
+    Invocations that never log skip that work entirely.
+    """
+    def __getattr__(self, name):
+        global LOG
+        from _logging_setup import get_logger
+        LOG = get_logger("task-tracker")
+        return getattr(LOG, name)
 
-LOG = get_logger("task-tracker")
+LOG = _LazyLogger()
 
 class TaskStatus(Enum):
     """Represents the status of a task."""
@@ -47,7 +49,10 @@ class TaskStatus(Enum):
     IN_PROGRESS = "in-progress"
     DONE = "done"
 
-@dataclass
+# Built once so hot paths skip the Enum.__call__ -> _missing_ machinery
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a task in the task tracker.
@@ -65,7 +70,7 @@ class Task:
     created_at: str = datetime.now().isoformat()
     updated_at: str = datetime.now().isoformat()
 
-def validate_task_name(task_name: str) -> Tuple[bool, str]:
+def validate_task_name(task_name: str) -> tuple[bool, str]:
     """
     Validates the name of a task.
 
@@ -73,99 +78,275 @@ def validate_task_name(task_name: str) -> Tuple[bool, str]:
         task_name (str): The task name to validate.
 
     Returns:
-        Tuple[bool, str]: A tuple containing a boolean indicating if the task name is valid,
+        tuple[bool, str]: A tuple containing a boolean indicating if the task name is valid,
                           and a string with an error message if invalid.
     """
-    if not task_name.strip():
-        return False, "Task name cannot be empty."
-    if len(task_name) > MAX_TASK_NAME_LENGTH:
+    length = len(task_name)
+    if length > MAX_TASK_NAME_LENGTH:
         return False, f"Task name cannot exceed {MAX_TASK_NAME_LENGTH} characters."
-    if any(c in task_name for c in '/\\'):
+    if length == 0 or task_name.isspace():
+        return False, "Task name cannot be empty."
+    if "/" in task_name or "\\" in task_name:
         return False, "Task name cannot contain slashes."
     return True, ""
 
-def load_tasks() -> List[Task]:
+# Tasks parsed once per process, indexed by id; invalidated when the
+# files change on disk.
+_TASKS_BY_ID: dict | None = None
+_CACHE_STAMP: tuple | None = None
+
+def _storage_stamp() -> tuple:
     """
-    Loads tasks from a JSON file.
+    Returns a stamp of the on-disk state of the snapshot and journal
+    files, used to detect whether the in-process cache is still fresh.
 
     Returns:
-        List[Task]: A list of Task objects loaded from the JSON file. If the file is not found or is empty,
-                    an empty list is returned.
+        tuple: Per-file (st_mtime_ns, st_size) pairs, or None for a
+               missing file.
     """
+    stamp = []
+    for path in (TASKS_FILE, TASKS_LOG_FILE):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def _apply_op(tasks_by_id: dict, record: dict):
+    """
+    Applies a single journal record to the in-memory task mapping.
+
+    Args:
+        tasks_by_id (dict): Mapping of task ID to Task, mutated in place.
+        record (dict): A decoded journal record with an "op" key
+                       ('add', 'update', 'status' or 'delete').
+    """
+    op = record["op"]
+    if op == "add":
+        tasks_by_id[record["id"]] = Task(
+            id=record["id"],
+            name=record["name"],
+            created_at=record["createdAt"],
+            updated_at=record["updatedAt"]
+        )
+    elif op == "update":
+        task = tasks_by_id.get(record["id"])
+        if task is not None:
+            task.name = record["name"]
+            task.updated_at = record["updatedAt"]
+    elif op == "status":
+        task = tasks_by_id.get(record["id"])
+        if task is not None:
+            task.status = _STATUS_BY_VALUE[record["status"]]
+            task.updated_at = record["updatedAt"]
+    elif op == "delete":
+        tasks_by_id.pop(record["id"], None)
+
+def _append_op(record: dict):
+    """
+    Appends a single mutation record to the JSONL journal.
+
+    Args:
+        record (dict): The journal record to append.
+    """
+    global _CACHE_STAMP
+    with open(TASKS_LOG_FILE, "ab") as file:
+        file.write(_dumps(record) + b"\n")
+    # The mutating caller already updated the cached mapping in place,
+    # so re-stamp rather than invalidate.
+    _CACHE_STAMP = _storage_stamp()
+
+def _compact(tasks_by_id: dict, fsync: bool = True):
+    """
+    Writes the snapshot from the given mapping and truncates the journal.
+
+    Args:
+        tasks_by_id (dict): The current, fully replayed task mapping.
+        fsync (bool): Passed through to save_tasks.
+    """
+    global _CACHE_STAMP
+    save_tasks(list(tasks_by_id.values()), fsync=fsync)
+    open(TASKS_LOG_FILE, "w").close()
+    _CACHE_STAMP = _storage_stamp()
+
+def _maybe_compact(tasks_by_id: dict):
+    """
+    Compacts the journal into the snapshot file once it grows past
+    COMPACT_THRESHOLD.
+
+    Args:
+        tasks_by_id (dict): The current, fully replayed task mapping.
+    """
+    try:
+        log_size = os.path.getsize(TASKS_LOG_FILE)
+    except OSError:
+        return
+    if log_size > COMPACT_THRESHOLD:
+        _compact(tasks_by_id)
+
+def _load_tasks_by_id() -> dict:
+    """
+    Loads tasks from the JSON snapshot file and replays the append-only
+    journal on top of it, producing an id-indexed mapping for O(1)
+    lookup and delete.
+
+    Repeated calls within one process return a cached mapping as long
+    as neither file changed on disk.
+
+    Returns:
+        dict: A mapping of task ID to Task reconstructed from the
+              snapshot and journal. If neither file is found or the
+              snapshot is corrupt, an empty mapping is returned.
+    """
+    global _TASKS_BY_ID, _CACHE_STAMP
+    stamp = _storage_stamp()
+    if _TASKS_BY_ID is not None and stamp == _CACHE_STAMP:
+        return _TASKS_BY_ID
+
+    tasks_by_id = {}
     try:
-        with open(TASKS_FILE, "r") as file:
-            tasks_data = json.load(file)
-            return [
-                Task(
-                    id=task['id'], 
-                    name=task['name'], 
-                    status=TaskStatus(task['status']),
+        with open(TASKS_FILE, "rb") as file:
+            tasks_data = _loads(file.read())
+            for task in tasks_data:
+                tasks_by_id[task['id']] = Task(
+                    id=task['id'],
+                    name=task['name'],
+                    status=_STATUS_BY_VALUE[task['status']],
                     created_at=task['createdAt'],
                     updated_at=task['updatedAt']
                 )
-                for task in tasks_data
-            ]
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+    except (FileNotFoundError, ValueError):
+        pass
+
+    try:
+        with open(TASKS_LOG_FILE, "rb") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # Tolerate a partial trailing line from a crashed append
+                    continue
+                _apply_op(tasks_by_id, record)
+    except FileNotFoundError:
+        pass
+
+    _TASKS_BY_ID = tasks_by_id
+    _CACHE_STAMP = stamp
+    return tasks_by_id
+
+def load_tasks() -> list[Task]:
+    """
+    Loads tasks as a list, in snapshot-then-journal order.
 
-def save_tasks(tasks: List[Task]):
+    Returns:
+        list[Task]: A list of Task objects. If no task files are found,
+                    an empty list is returned.
+    """
+    return list(_load_tasks_by_id().values())
+
+def save_tasks(tasks: list[Task], fsync: bool = True):
     """
-    Saves a list of tasks to a JSON file.
+    Saves a full list of tasks to the JSON snapshot file. Routine
+    mutations go through the journal instead; this is only called when
+    the journal is compacted.
+
+    The snapshot is written to a temporary file in the same directory
+    and swapped in with os.replace, so a crash mid-write can never
+    leave a truncated tasks.json behind.
 
     Args:
-        tasks (List[Task]): The list of Task objects to be saved.
-    """
-    with open(TASKS_FILE, "w") as file:
-        json.dump(
-            [
-                {
-                    "id": task.id, 
-                    "name": task.name, 
-                    "status": task.status.value, 
-                    "createdAt": task.created_at, 
-                    "updatedAt": task.updated_at
-                } 
-                for task in tasks
-            ], 
-            file, 
-            indent=4
+        tasks (list[Task]): The list of Task objects to be saved.
+        fsync (bool): Whether to fsync the temporary file before the
+                      rename. Batch callers skip it to amortize the cost.
+    """
+    import tempfile
+
+    # Assemble the rows directly as bytes: only the name needs real JSON
+    # escaping, so this skips allocating an intermediate dict per task.
+    rows = []
+    append = rows.append
+    for task in tasks:
+        append(
+            b'{"id":' + str(task.id).encode()
+            + b',"name":' + _dumps(task.name)
+            + b',"status":"' + task.status.value.encode()
+            + b'","createdAt":"' + task.created_at.encode()
+            + b'","updatedAt":"' + task.updated_at.encode()
+            + b'"}'
         )
-
-def add_task(task_name: str):
+    payload = b"[" + b",".join(rows) + b"]"
+    tmp = tempfile.NamedTemporaryFile(
+        mode="wb",
+        dir=os.path.dirname(TASKS_FILE) or ".",
+        prefix=TASKS_FILE + ".",
+        delete=False
+    )
+    try:
+        with tmp as file:
+            file.write(payload)
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+        os.replace(tmp.name, TASKS_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+def add_task(task_name: str, tasks_by_id: dict | None = None):
     """
     Adds a new task to the task tracker.
 
     Args:
         task_name (str): The name of the task to add.
-    
+        tasks_by_id (dict | None): An already-loaded task mapping to
+                                      mutate in place; persistence is then
+                                      left to the caller (used by batch_ops).
+
     Returns:
         None
     """
-    tasks = load_tasks()
-    new_id = max([task.id for task in tasks], default=0) + 1
+    defer_persist = tasks_by_id is not None
+    if tasks_by_id is None:
+        tasks_by_id = _load_tasks_by_id()
+    new_id = max(tasks_by_id, default=0) + 1
+    now = datetime.now().isoformat()
     new_task = Task(
-        id=new_id, 
-        name=task_name, 
-        created_at=datetime.now().isoformat(), 
-        updated_at=datetime.now().isoformat()
+        id=new_id,
+        name=task_name,
+        created_at=now,
+        updated_at=now
     )
-    tasks.append(new_task)
-    save_tasks(tasks)
+    tasks_by_id[new_id] = new_task
+    if not defer_persist:
+        _append_op({"op": "add", "id": new_id, "name": task_name, "createdAt": now, "updatedAt": now})
+        _maybe_compact(tasks_by_id)
     LOG.info(f"[+] New task '{task_name}' added.")
 
-def update_task(task_id: int, updated_name: str):
+def update_task(task_id: int, updated_name: str, tasks_by_id: dict | None = None):
     """
     Updates the name of a task with the given task_id.
 
     Args:
         task_id (int): The ID of the task to update.
         updated_name (str): The new name for the task.
-    
+        tasks_by_id (dict | None): An already-loaded task mapping to
+                                      mutate in place; persistence is then
+                                      left to the caller (used by batch_ops).
+
     Returns:
         None
     """
-    tasks = load_tasks()
-    task_to_update = next((task for task in tasks if task.id == task_id), None)
+    defer_persist = tasks_by_id is not None
+    if tasks_by_id is None:
+        tasks_by_id = _load_tasks_by_id()
+    task_to_update = tasks_by_id.get(task_id)
 
     if task_to_update is None:
         LOG.error(f"Task with ID {task_id} not found.")
@@ -180,65 +361,77 @@ def update_task(task_id: int, updated_name: str):
     task_to_update.name = updated_name
     task_to_update.updated_at = datetime.now().isoformat()
 
-    save_tasks(tasks)
+    if not defer_persist:
+        _append_op({"op": "update", "id": task_id, "name": updated_name, "updatedAt": task_to_update.updated_at})
+        _maybe_compact(tasks_by_id)
     LOG.info(f"[+u] Task ID {task_id} updated successfully to '{updated_name}'.")
 
 
-def delete_task(task_id: int):
+def delete_task(task_id: int, tasks_by_id: dict | None = None):
     """
     Deletes a task with the given task_id from the task tracker.
 
     Args:
         task_id (int): The ID of the task to delete.
-    
+        tasks_by_id (dict | None): An already-loaded task mapping to
+                                      mutate in place; persistence is then
+                                      left to the caller (used by batch_ops).
+
     Returns:
         None
     """
-    # Load existing tasks from the file
-    tasks = load_tasks()
+    defer_persist = tasks_by_id is not None
+    if tasks_by_id is None:
+        # Load existing tasks from the file
+        tasks_by_id = _load_tasks_by_id()
 
-    # Find the task by ID
-    task_to_delete = next((task for task in tasks if task.id == task_id), None)
+    # Find and remove the task by ID in one O(1) step
+    task_to_delete = tasks_by_id.pop(task_id, None)
 
     if task_to_delete is None:
         LOG.error(f"Task with ID {task_id} not found.")
         return
 
-    # Remove the task from the list
-    tasks = [task for task in tasks if task.id != task_id]
+    if not defer_persist:
+        _append_op({"op": "delete", "id": task_id})
+        _maybe_compact(tasks_by_id)
 
-    # Save the updated task list back to the file
-    save_tasks(tasks)
-    
     LOG.info(f"[-] Task ID {task_id} deleted.")
 
 
-def update_status(task_id: int, updated_status: str):
+def update_status(task_id: int, updated_status: str, tasks_by_id: dict | None = None):
     """
     Updates the status of a task with the given task_id.
 
     Args:
         task_id (int): The ID of the task to update.
         updated_status (str): The new status for the task ('todo', 'in-progress', 'done').
-    
+        tasks_by_id (dict | None): An already-loaded task mapping to
+                                      mutate in place; persistence is then
+                                      left to the caller (used by batch_ops).
+
     Returns:
         None
     """
-    valid_statuses = [status.value for status in TaskStatus]
-    tasks = load_tasks()
-    task_to_update = next((task for task in tasks if task.id == task_id), None)
+    defer_persist = tasks_by_id is not None
+    if tasks_by_id is None:
+        tasks_by_id = _load_tasks_by_id()
+    task_to_update = tasks_by_id.get(task_id)
 
     if task_to_update is None:
         LOG.error(f"Task with ID {task_id} not found.")
         return
 
-    if updated_status.lower() not in valid_statuses:
-        LOG.error(f"'{updated_status}' is not a valid status. Valid statuses are: {valid_statuses}.")
+    updated_status = updated_status.lower()
+    if updated_status not in _STATUS_BY_VALUE:
+        LOG.error(f"'{updated_status}' is not a valid status. Valid statuses are: {list(_STATUS_BY_VALUE)}.")
         return
 
-    task_to_update.status = TaskStatus(updated_status.lower())
+    task_to_update.status = _STATUS_BY_VALUE[updated_status]
     task_to_update.updated_at = datetime.now().isoformat()  # Update timestamp
-    save_tasks(tasks)
+    if not defer_persist:
+        _append_op({"op": "status", "id": task_id, "status": task_to_update.status.value, "updatedAt": task_to_update.updated_at})
+        _maybe_compact(tasks_by_id)
 
     LOG.info(f"[+u] Task ID {task_id} status updated successfully to '{updated_status}'.")
 
@@ -272,6 +465,62 @@ def list_tasks(task_status: str):
             print(f"ID: {task.id}, Name: {task.name}, Status: {task.status.value}, Created At: {task.created_at}, Updated At: {task.updated_at}")
 
 
+def batch_ops(batch_file: str | None):
+    """
+    Applies a newline-delimited batch of operations, sharing a single
+    load and a single save across the whole batch.
+
+    Each line is a JSON object such as {"op": "add", "name": "..."},
+    {"op": "update", "id": 1, "name": "..."}, {"op": "mark", "id": 1,
+    "status": "done"} or {"op": "delete", "id": 1}.
+
+    Args:
+        batch_file (str | None): Path to the operations file, or None
+                                    to read from stdin.
+
+    Returns:
+        None
+    """
+    tasks_by_id = _load_tasks_by_id()
+    stream = open(batch_file, "r") if batch_file else sys.stdin
+    applied = 0
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _loads(line)
+            except ValueError:
+                LOG.error(f"Skipping malformed batch line: {line!r}")
+                continue
+            op = record.get("op")
+            if op == "add":
+                valid, error_message = validate_task_name(record.get("name", ""))
+                if not valid:
+                    LOG.error(f"Task input validation: {error_message}")
+                    continue
+                add_task(record["name"], tasks_by_id)
+            elif op == "update":
+                update_task(record["id"], record["name"], tasks_by_id)
+            elif op == "mark":
+                update_status(record["id"], record["status"], tasks_by_id)
+            elif op == "delete":
+                delete_task(record["id"], tasks_by_id)
+            else:
+                LOG.error(f"Skipping unknown batch op: {op!r}")
+                continue
+            applied += 1
+    finally:
+        if batch_file:
+            stream.close()
+
+    # One snapshot write for the whole batch; fsync is skipped since the
+    # cost is amortized across the batch.
+    _compact(tasks_by_id, fsync=False)
+    LOG.info(f"[+b] Applied {applied} batch operation(s).")
+
+
 def handle_task(args: argparse.Namespace):
     if args.action in ["add", "update"]:
         valid, error_message = validate_task_name(args.name)
@@ -282,38 +531,146 @@ def handle_task(args: argparse.Namespace):
     if args.action == "add":
         add_task(args.name)
     elif args.action == "update":
-        update_task(int(args.id), args.name)
+        update_task(args.id, args.name)
     elif args.action == "delete":
-        delete_task(int(args.id))
+        delete_task(args.id)
     elif args.action == "mark":
-        update_status(int(args.id), args.status)
+        update_status(args.id, args.status)
     elif args.action == "list":
         list_tasks(args.status)
+    elif args.action == "batch":
+        batch_ops(args.file)
     else:
         LOG.error(f"Invalid action: {args.action}")
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Task tracker CLI")
-    subparsers = parser.add_subparsers(help="list of actions", dest="action", required=True)
+_USAGE = """\
+usage: tracker.py [-h] [--version] {add,update,mark,delete,list,batch} ...
 
-    add_task_parser = subparsers.add_parser("add", help="Add task related arguments")
-    add_task_parser.add_argument("name", type=str, help="Name of the task to add")
+Task tracker CLI
 
-    update_task_parser = subparsers.add_parser("update", help="Update task related arguments")
-    update_task_parser.add_argument("id", type=int, help="Task ID")
-    update_task_parser.add_argument("name", type=str, help="Task's new name")
-    
-    mark_task_parser = subparsers.add_parser("mark", help="Update task status related arguments")
-    mark_task_parser.add_argument("id", type=int, help="Task ID")
-    mark_task_parser.add_argument("status", choices=["todo", "in-progress", "done"], help="Task's new status")
+actions:
+  add <name>            Add a new task
+  update <id> <name>    Update a task's name
+  mark <id> <status>    Update a task's status (todo, in-progress, done)
+  delete <id>           Delete a task
+  list [status]         List tasks (all, todo, in-progress, done)
+  batch [--file FILE]   Apply JSONL operations from a file or stdin
+
+options:
+  -h, --help            show this help message and exit
+  --version             show the version number and exit"""
 
-    delete_task_parser = subparsers.add_parser("delete", help="Delete task related arguments")
-    delete_task_parser.add_argument("id", type=int, help="Task ID")
-    
-    list_task_parser = subparsers.add_parser("list", help="List tasks related arguments")
-    list_task_parser.add_argument("status", nargs="?", choices=["all", "todo", "in-progress", "done"], default="all", help="Task type")
 
-    args = parser.parse_args()
+def main(argv: list[str] | None = None):
+    """
+    Command-line entry point, also exposed as the task-tracker console
+    script when the package is installed.
+
+    Args:
+        argv (list[str] | None): Arguments to parse instead of sys.argv.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Sniff the subcommand before importing argparse so we only pay for
+    # building the one subparser the user actually invoked.
+    cmd = argv[0] if argv else None
+
+    # Fast paths: answer help/version from static text and exit before
+    # paying for argparse at all.
+    if cmd == "--version":
+        print(f"task-tracker {__version__}")
+        sys.exit(0)
+    if cmd is None or cmd in ("-h", "--help"):
+        print(_USAGE)
+        sys.exit(0)
+
+    import argparse
+
+    def _build_add():
+        parser = argparse.ArgumentParser(prog="tracker.py add", description="Add task related arguments")
+        parser.add_argument("name", type=str, help="Name of the task to add")
+        parser.set_defaults(action="add")
+        return parser
+
+    def _build_update():
+        parser = argparse.ArgumentParser(prog="tracker.py update", description="Update task related arguments")
+        parser.add_argument("id", type=int, help="Task ID")
+        parser.add_argument("name", type=str, help="Task's new name")
+        parser.set_defaults(action="update")
+        return parser
+
+    def _build_mark():
+        parser = argparse.ArgumentParser(prog="tracker.py mark", description="Update task status related arguments")
+        parser.add_argument("id", type=int, help="Task ID")
+        parser.add_argument("status", choices=["todo", "in-progress", "done"], help="Task's new status")
+        parser.set_defaults(action="mark")
+        return parser
+
+    def _build_delete():
+        parser = argparse.ArgumentParser(prog="tracker.py delete", description="Delete task related arguments")
+        parser.add_argument("id", type=int, help="Task ID")
+        parser.set_defaults(action="delete")
+        return parser
+
+    def _build_list():
+        parser = argparse.ArgumentParser(prog="tracker.py list", description="List tasks related arguments")
+        parser.add_argument("status", nargs="?", choices=["all", "todo", "in-progress", "done"], default="all", help="Task type")
+        parser.set_defaults(action="list")
+        return parser
+
+    def _build_batch():
+        parser = argparse.ArgumentParser(prog="tracker.py batch", description="Batch operations related arguments")
+        parser.add_argument("--file", type=str, default=None, help="Path to a JSONL operations file (defaults to stdin)")
+        parser.set_defaults(action="batch")
+        return parser
+
+    def _build_full_parser():
+        parser = argparse.ArgumentParser(description="Task tracker CLI")
+        subparsers = parser.add_subparsers(help="list of actions", dest="action", required=True)
+
+        add_task_parser = subparsers.add_parser("add", help="Add task related arguments")
+        add_task_parser.add_argument("name", type=str, help="Name of the task to add")
+
+        update_task_parser = subparsers.add_parser("update", help="Update task related arguments")
+        update_task_parser.add_argument("id", type=int, help="Task ID")
+        update_task_parser.add_argument("name", type=str, help="Task's new name")
+
+        mark_task_parser = subparsers.add_parser("mark", help="Update task status related arguments")
+        mark_task_parser.add_argument("id", type=int, help="Task ID")
+        mark_task_parser.add_argument("status", choices=["todo", "in-progress", "done"], help="Task's new status")
+
+        delete_task_parser = subparsers.add_parser("delete", help="Delete task related arguments")
+        delete_task_parser.add_argument("id", type=int, help="Task ID")
+
+        list_task_parser = subparsers.add_parser("list", help="List tasks related arguments")
+        list_task_parser.add_argument("status", nargs="?", choices=["all", "todo", "in-progress", "done"], default="all", help="Task type")
+
+        batch_task_parser = subparsers.add_parser("batch", help="Batch operations related arguments")
+        batch_task_parser.add_argument("--file", type=str, default=None, help="Path to a JSONL operations file (defaults to stdin)")
+
+        return parser
+
+    builders = {
+        "add": _build_add,
+        "update": _build_update,
+        "mark": _build_mark,
+        "delete": _build_delete,
+        "list": _build_list,
+        "batch": _build_batch,
+    }
+
+    builder = builders.get(cmd)
+    if builder is not None:
+        args = builder().parse_args(argv[1:])
+    else:
+        # Unknown command: fall back to the full parser so argparse
+        # produces the usual error output.
+        args = _build_full_parser().parse_args(argv)
 
     handle_task(args)
+
+
+if __name__ == "__main__":
+    main()